@@ -6,14 +6,17 @@ This script automates the process of screening resumes for fast food industry re
 
 import os
 import time
+import csv
+import hashlib
+import json
 import fitz  # PyMuPDF
+import numpy as np
 import pandas as pd
-import smtplib
 import re
 import logging
-import matplotlib.pyplot as plt
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -38,40 +41,106 @@ OUTPUT_DIR = "./output/"
 PROCESSED_DIR = "./input_cv/processed/"
 KEYWORDS_FILE = "keywords.txt"
 OUTPUT_CSV = os.path.join(OUTPUT_DIR, "output_candidates.csv")
+EXTRACTED_CSV = os.path.join(OUTPUT_DIR, "extracted_resumes.csv")
+RESUME_FIELDS = ["name", "email", "phone", "experience", "skills", "keyword_count",
+                 "found_keywords", "is_relevant", "file_name"]
 SURVEY_RESPONSES = "sample_responses.csv"
+RESUME_CACHE_DIR = Path("./.cache/resumes")
+SCRIPT_MTIME = os.path.getmtime(__file__)
 INTERVIEW_DATE = (datetime.now() + timedelta(days=14)).strftime("%d/%m/%Y")
 INTERVIEW_TIME = "10:00 AM"
 
+# Survey scoring
+AVAILABILITY_SCORES = {
+    "full availability": 4,  # Highest value for full availability
+    "morning": 3,            # High demand for morning shifts
+    "night": 1               # Lower demand for night shifts
+}
+VISA_SCORES = {
+    "irish": 4,     # Irish citizens (no visa issues)
+    "stamp 4": 3,   # Stamp 4 (broader work permissions)
+    "ue": 3,        # EU citizens (freedom of movement)
+    "stamp 1g": 2,  # Stamp 1G (graduate visa)
+    "stamp 2": 1,   # Stamp 2 (limited work rights, typically students)
+    "stamp 1": 0    # Stamp 1 (may have work restrictions)
+}
+
+# Email configuration
+EMAIL_SENDER = os.getenv("EMAIL_SENDER", "hr@fastfood.example.com")
+EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+# Emails are only simulated unless sending is explicitly enabled
+SEND_EMAILS = os.getenv("SEND_EMAILS", "false").lower() == "true"
+
+MIN_RELEVANT_KEYWORDS = 2
+CONTACT_SEARCH_CHARS = 1500  # Leading chars searched for email/phone before the full text
+# Stop reading a PDF once it is known to be relevant and has contact details
+# (faster on long resumes, but keyword counts then only cover the pages read)
+FAST_TRIAGE = os.getenv("FAST_TRIAGE", "false").lower() == "true"
+
+# Precompiled regex patterns for resume parsing
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'\b(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+HEADER_RE = re.compile(r'\n\s*(?P<hdr>(?:WORK |PROFESSIONAL )?EXPERIENCE|(?:TECHNICAL |KEY |CORE )?SKILLS|EDUCATION|WORK HISTORY|EMPLOYMENT'
+                       r'|QUALIFICATIONS)[ \t]*:?[ \t]*(?=\n|$)', re.IGNORECASE)
+EXPERIENCE_HEADERS = {"EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE", "WORK HISTORY", "EMPLOYMENT"}
+SKILLS_HEADERS = {"SKILLS", "TECHNICAL SKILLS", "KEY SKILLS", "CORE SKILLS", "QUALIFICATIONS"}
+
 # Create necessary directories if they don't exist
 os.makedirs(INPUT_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(PROCESSED_DIR, exist_ok=True)
+os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+
+# NLP tools are loaded lazily on first use (see get_spacy_model)
+_spacy_model = None
+_nlp_initialized = False
 
-# Try to initialize NLP tools, but continue without them if not available
+# Use an Aho-Corasick automaton for keyword matching when available
 try:
-    import nltk
-    import spacy
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+    import ahocorasick
+    ahocorasick_available = True
+except ImportError:
+    logger.warning("pyahocorasick not available, falling back to simple keyword matching")
+    ahocorasick_available = False
+
+
+def get_spacy_model():
+    """Load the spaCy model and NLTK data on first use; returns None if NLP is not available."""
+    global _spacy_model, _nlp_initialized
+    if _nlp_initialized:
+        return _spacy_model
+    _nlp_initialized = True
+    
+    try:
+        import nltk
+        import spacy
+    except ImportError:
+        logger.warning("NLP libraries not available, continuing without NLP capabilities")
+        return None
+    
+    # Only download NLTK data that isn't installed yet
+    for resource, path in (("punkt", "tokenizers/punkt"), ("stopwords", "corpora/stopwords")):
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(resource, quiet=True)
+    
     try:
-        spacy_model = spacy.load("en_core_web_sm")
-        nlp_available = True
+        _spacy_model = spacy.load("en_core_web_sm", disable=["parser", "ner"])
         logger.info("NLP tools initialized successfully")
-    except:
+    except Exception:
         logger.warning("spaCy model not available, continuing without NLP capabilities")
-        spacy_model = None
-        nlp_available = False
-except ImportError:
-    logger.warning("NLP libraries not available, continuing without NLP capabilities")
-    nlp_available = False
-    spacy_model = None
+    return _spacy_model
 
 
 def load_keywords():
     """Load keywords from the keywords file."""
     try:
-        with open(KEYWORDS_FILE, 'r') as f:
-            keywords = [line.strip().lower() for line in f if line.strip()]
+        lines = Path(KEYWORDS_FILE).read_text(encoding="utf-8").splitlines()
+        # Lowercase once here and drop duplicates while keeping file order
+        keywords = list(dict.fromkeys(line.strip().lower() for line in lines if line.strip()))
         logger.info(f"Loaded {len(keywords)} keywords")
         return keywords
     except FileNotFoundError:
@@ -85,37 +154,70 @@ def load_keywords():
         return default_keywords
 
 
+def build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton that matches all keywords in one pass."""
+    if not ahocorasick_available or not keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)  # Keywords are already lowercased by load_keywords
+    automaton.make_automaton()
+    return automaton
+
+
 def extract_text_from_pdf(pdf_path):
     """Extract text from a PDF file."""
     try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
+        # Plain text in content-stream order (no reading-order sort), joined once
+        with fitz.open(pdf_path) as doc:
+            return "".join(page.get_text("text", sort=False) for page in doc)
     except Exception as e:
         logger.error(f"Error extracting text from {pdf_path}: {e}")
         return ""
 
 
+def extract_text_until_relevant(pdf_path, keywords, automaton=None):
+    """Extract text page by page, stopping early once the resume is relevant and has an email and phone.
+    
+    Returns the text read and the keywords found in it, so they do not need to be matched again."""
+    try:
+        parts = []
+        found_keywords = set()
+        email = phone = None
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                page_text = page.get_text("text", sort=False)
+                parts.append(page_text)
+                
+                found_keywords.update(count_relevant_keywords(page_text.lower(), keywords, automaton)[1])
+                email = email or EMAIL_RE.search(page_text)
+                phone = phone or PHONE_RE.search(page_text)
+                if len(found_keywords) >= MIN_RELEVANT_KEYWORDS and email and phone:
+                    break
+        return "".join(parts), sorted(found_keywords)
+    except Exception as e:
+        logger.error(f"Error extracting text from {pdf_path}: {e}")
+        return "", []
+
+
 def extract_contact_info(text):
     """Extract name, email, and phone from the resume text."""
-    # Simple regex patterns for extraction
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    phone_pattern = r'\b(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
+    # Contact details are almost always near the top, so search whole lines there first
+    head = text[:CONTACT_SEARCH_CHARS].rpartition('\n')[0]
     
     # Extract email and phone
-    email = re.search(email_pattern, text)
+    email = EMAIL_RE.search(head) or EMAIL_RE.search(text)
     email = email.group(0) if email else ""
     
-    phone = re.search(phone_pattern, text)
+    phone = PHONE_RE.search(head) or PHONE_RE.search(text)
     phone = phone.group(0) if phone else ""
     
     # Extract name (simplified approach - first 2-3 words at the beginning)
-    lines = text.strip().split('\n')
+    lines = text.strip().split('\n', 5)
     name = ""
     for line in lines[:5]:  # Check first few lines
-        if line.strip() and not re.search(email_pattern, line) and not re.search(phone_pattern, line):
+        if line.strip() and not EMAIL_RE.search(line) and not PHONE_RE.search(line):
             # Take first 2-3 words as name
             name_parts = line.strip().split()[:3]
             name = ' '.join(name_parts)
@@ -126,49 +228,66 @@ def extract_contact_info(text):
 
 def extract_experience_and_skills(text, keywords):
     """Extract experience and skills from the resume text."""
-    # Simple approach: look for sections like "Experience", "Skills", etc.
-    sections = re.split(r'\n\s*(?:EXPERIENCE|SKILLS|EDUCATION|WORK HISTORY|EMPLOYMENT|PROFESSIONAL EXPERIENCE)(?:\s*|:)', 
-                       text, flags=re.IGNORECASE)
-    
-    # Get experience (simplified)
-    experience = ""
-    if len(sections) > 1:
-        experience = sections[1].strip()[:500]  # Limit to 500 chars
-    
-    # Skills section
-    skills_section = ""
-    for i, section in enumerate(sections):
-        if i > 0 and re.search(r'SKILLS|QUALIFICATIONS', sections[i-1], re.IGNORECASE):
-            skills_section = section.strip()[:500]  # Limit to 500 chars
-            break
-    
-    # If no clear skills section, use the last section
-    if not skills_section and len(sections) > 2:
-        skills_section = sections[-1].strip()[:500]
+    # Find labelled section headers in one pass; each body runs until the next header
+    matches = list(HEADER_RE.finditer(text))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        # Map each header to its section kind, keeping the first section of each kind
+        label = match.group("hdr").upper()
+        kind = "experience" if label in EXPERIENCE_HEADERS else "skills" if label in SKILLS_HEADERS else label
+        sections.setdefault(kind, text[match.end():end].strip())
+    
+    experience = sections.get("experience", "")[:500]  # Limit to 500 chars
+    skills_section = sections.get("skills", "")[:500]  # Limit to 500 chars
     
     return experience, skills_section
 
 
-def count_relevant_keywords(text, keywords):
-    """Count the number of relevant keywords in the text."""
-    text_lower = text.lower()
-    count = 0
-    found_keywords = []
-    
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            count += 1
-            found_keywords.append(keyword)
+def count_relevant_keywords(text_lower, keywords, automaton=None):
+    """Count the number of relevant keywords in the lowercased resume text."""
+    # Collect matches in a set so repeated keywords are only counted once
+    if automaton is not None:
+        # Single scan over the text
+        found = {keyword for _, keyword in automaton.iter(text_lower)}
+    else:
+        # Keywords are already lowercased by load_keywords
+        found = {keyword for keyword in keywords if keyword in text_lower}
     
-    return count, found_keywords
+    return len(found), sorted(found)
+
 
+def get_resume_cache_path(pdf_path, keywords):
+    """Return the cache file for a resume, keyed on its content and the extraction settings."""
+    # Include keywords, triage mode and script version so stale results are never reused
+    hasher = hashlib.sha1(Path(pdf_path).read_bytes())
+    hasher.update("\n".join(keywords).encode())
+    hasher.update(f"{FAST_TRIAGE}:{SCRIPT_MTIME}".encode())
+    return RESUME_CACHE_DIR / f"{hasher.hexdigest()}.json"
 
-def process_resume(pdf_path, keywords):
+
+def process_resume(pdf_path, keywords, automaton=None):
     """Process a single resume PDF."""
     logger.info(f"Processing resume: {pdf_path}")
     
-    # Extract text from PDF
-    text = extract_text_from_pdf(pdf_path)
+    # Reuse data extracted from an identical file on an earlier run
+    try:
+        cache_file = get_resume_cache_path(pdf_path, keywords)
+        if cache_file.exists():
+            resume_data = json.loads(cache_file.read_text())
+            resume_data["file_name"] = os.path.basename(pdf_path)
+            logger.info(f"Loaded cached data for {pdf_path}")
+            return resume_data
+    except (OSError, ValueError) as e:
+        logger.warning(f"Resume cache unavailable for {pdf_path}: {e}")
+        cache_file = None
+    
+    # Extract text from PDF; in triage mode keywords are matched page by page while reading
+    if FAST_TRIAGE:
+        text, found_keywords = extract_text_until_relevant(pdf_path, keywords, automaton)
+    else:
+        text = extract_text_from_pdf(pdf_path)
+        found_keywords = None
     if not text:
         logger.warning(f"No text extracted from {pdf_path}")
         return None
@@ -179,11 +298,13 @@ def process_resume(pdf_path, keywords):
     # Extract experience and skills
     experience, skills = extract_experience_and_skills(text, keywords)
     
-    # Count relevant keywords
-    keyword_count, found_keywords = count_relevant_keywords(text, keywords)
+    # Count relevant keywords (already done while reading in triage mode)
+    if found_keywords is None:
+        found_keywords = count_relevant_keywords(text.lower(), keywords, automaton)[1]
+    keyword_count = len(found_keywords)
     
     # Check if resume is relevant (at least 2 keywords)
-    is_relevant = keyword_count >= 2
+    is_relevant = keyword_count >= MIN_RELEVANT_KEYWORDS
     
     # Create a dictionary with the extracted information
     resume_data = {
@@ -199,24 +320,82 @@ def process_resume(pdf_path, keywords):
     }
     
     logger.info(f"Extracted data from {pdf_path}: {name}, {email}, Keywords: {keyword_count}")
+    
+    if cache_file is not None:
+        try:
+            cache_file.write_text(json.dumps(resume_data))
+        except OSError as e:
+            logger.warning(f"Could not cache data for {pdf_path}: {e}")
+    
     return resume_data
 
 
-def send_survey_email(candidate):
-    """Simulate sending a survey email to a candidate."""
+def _start_smtp_session(server):
+    """Upgrade a connected SMTP server to TLS and log in."""
+    server.ehlo()
+    server.starttls()
+    server.login(EMAIL_SENDER, EMAIL_PASSWORD)
+
+
+@contextmanager
+def smtp_session():
+    """Open one authenticated SMTP connection to reuse for a batch of emails (None when simulating or unavailable)."""
+    if not SEND_EMAILS:
+        yield None
+        return
+    
+    import smtplib
+    
+    # A mail server problem must not stop the run: skip sending this batch instead
+    server = None
+    try:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+        _start_smtp_session(server)
+    except (OSError, smtplib.SMTPException) as e:
+        logger.error(f"Could not open SMTP session with {SMTP_SERVER}:{SMTP_PORT}, "
+                     f"emails in this batch will not be sent: {e}")
+        if server is not None:
+            server.close()
+        server = None
+    
+    if server is None:
+        yield None
+        return
+    
+    try:
+        yield server
+    finally:
+        try:
+            server.quit()
+        except (OSError, smtplib.SMTPException):
+            server.close()
+
+
+def send_smtp_message(smtp, message):
+    """Send a message over the shared SMTP session, reconnecting once if the server dropped it."""
+    import smtplib
+    
+    try:
+        smtp.send_message(message)
+    except smtplib.SMTPServerDisconnected:
+        logger.warning(f"SMTP connection to {SMTP_SERVER} lost, reconnecting")
+        smtp.connect(SMTP_SERVER, SMTP_PORT)
+        _start_smtp_session(smtp)
+        smtp.send_message(message)
+
+
+def send_survey_email(candidate, smtp=None):
+    """Send (or simulate sending) a survey email to a candidate."""
     if not candidate["email"]:
         logger.warning(f"No email found for {candidate['name']}")
         return False
     
-    # Email configuration
-    sender_email = os.getenv("EMAIL_SENDER", "hr@fastfood.example.com")
-    password = os.getenv("EMAIL_PASSWORD", "")
-    smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    smtp_port = int(os.getenv("SMTP_PORT", "587"))
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
     
     # Create message
     message = MIMEMultipart()
-    message["From"] = sender_email
+    message["From"] = EMAIL_SENDER
     message["To"] = candidate["email"]
     message["Subject"] = "Fast Food Job Application - Next Steps"
     
@@ -236,35 +415,34 @@ Fast Food HR Team
     
     message.attach(MIMEText(body, "plain"))
     
-    # Simulate sending email (don't actually send in this demo)
+    # Send over the shared SMTP session, or simulate when sending is disabled
     try:
-        # In a real scenario, you would uncomment the following:
-        # with smtplib.SMTP(smtp_server, smtp_port) as server:
-        #     server.starttls()
-        #     server.login(sender_email, password)
-        #     server.send_message(message)
-        logger.info(f"[SIMULATION] Survey email sent to {candidate['email']}")
+        if smtp is None and SEND_EMAILS:
+            logger.error(f"Survey email to {candidate['email']} not sent: no SMTP session")
+            return False
+        if smtp is None:
+            logger.info(f"[SIMULATION] Survey email sent to {candidate['email']}")
+        else:
+            send_smtp_message(smtp, message)
+            logger.info(f"Survey email sent to {candidate['email']}")
         return True
     except Exception as e:
         logger.error(f"Error sending survey email to {candidate['email']}: {e}")
         return False
 
 
-def send_interview_email(candidate, priority):
-    """Simulate sending an interview invitation email to a candidate."""
+def send_interview_email(candidate, priority, smtp=None):
+    """Send (or simulate sending) an interview invitation email to a candidate."""
     if not candidate["email"]:
         logger.warning(f"No email found for {candidate['name']}")
         return False
     
-    # Email configuration
-    sender_email = os.getenv("EMAIL_SENDER", "hr@fastfood.example.com")
-    password = os.getenv("EMAIL_PASSWORD", "")
-    smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    smtp_port = int(os.getenv("SMTP_PORT", "587"))
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
     
     # Create message
     message = MIMEMultipart()
-    message["From"] = sender_email
+    message["From"] = EMAIL_SENDER
     message["To"] = candidate["email"]
     message["Subject"] = "Fast Food Job Application - Interview Invitation"
     
@@ -288,163 +466,161 @@ Priority: {priority}
     
     message.attach(MIMEText(body, "plain"))
     
-    # Simulate sending email (don't actually send in this demo)
+    # Send over the shared SMTP session, or simulate when sending is disabled
     try:
-        # In a real scenario, you would uncomment the following:
-        # with smtplib.SMTP(smtp_server, smtp_port) as server:
-        #     server.starttls()
-        #     server.login(sender_email, password)
-        #     server.send_message(message)
-        logger.info(f"[SIMULATION] Interview email sent to {candidate['email']} (Priority: {priority})")
+        if smtp is None and SEND_EMAILS:
+            logger.error(f"Interview email to {candidate['email']} not sent: no SMTP session")
+            return False
+        if smtp is None:
+            logger.info(f"[SIMULATION] Interview email sent to {candidate['email']} (Priority: {priority})")
+        else:
+            send_smtp_message(smtp, message)
+            logger.info(f"Interview email sent to {candidate['email']} (Priority: {priority})")
         return True
     except Exception as e:
         logger.error(f"Error sending interview email to {candidate['email']}: {e}")
         return False
 
 
+def _lowercase_column(df, column):
+    """Return a column as lowercase strings, keeping missing values (all missing if absent)."""
+    if column not in df:
+        return pd.Series(np.nan, index=df.index, dtype=object)
+    return df[column].astype(str).str.lower().where(df[column].notna())
+
+
+def _normalize_emails(emails):
+    """Return email addresses stripped and lowercased so resume and survey entries match."""
+    return emails.astype(str).str.strip().str.lower().where(emails.notna())
+
+
 def classify_candidates(resumes_df, survey_df):
     """Classify candidates based on resume and survey data."""
     # Merge resume and survey data
     if survey_df is not None and not survey_df.empty:
-        merged_df = pd.merge(resumes_df, survey_df, on="email", how="left", suffixes=("", "_survey"))
+        # Match on normalised emails, leaving the addresses themselves untouched,
+        # and index the survey side once for a hash join
+        survey_by_email = (
+            survey_df.assign(_email_key=_normalize_emails(survey_df["email"]))
+            .dropna(subset=["_email_key"])
+            .drop_duplicates("_email_key", keep="last")  # Keep the most recent response per candidate
+            .set_index("_email_key")
+            .drop(columns="email")
+        )
+        merged_df = (
+            resumes_df.assign(_email_key=_normalize_emails(resumes_df["email"]))
+            .join(survey_by_email, on="_email_key", how="left", rsuffix="_survey")
+            .drop(columns="_email_key")
+        )
     else:
-        # If no survey data, just use resume data
-        merged_df = resumes_df.copy()
-        merged_df["availability"] = "Unknown"
-        merged_df["courses"] = "Unknown"
-        merged_df["visa"] = "Unknown"
-    
-    # Calculate priority score
-    def calculate_priority(row):
-        score = 0
-        
-        # Resume factors
-        if row["is_relevant"]:
-            score += 2
-        score += min(row["keyword_count"], 5)  # Max 5 points for keywords
-        
-        # Survey factors (if available)
-        # Availability scoring
-        if "availability" in row and pd.notna(row["availability"]):
-            availability = str(row["availability"]).lower()
-            if availability == "full availability":
-                score += 4  # Highest value for full availability
-            elif availability == "morning":
-                score += 3  # High demand for morning shifts
-            elif availability == "night":
-                score += 1  # Lower demand for night shifts
-            else:
-                score += 1  # Default score for other availabilities
-        
-        # Course/training scoring
-        if "courses" in row and pd.notna(row["courses"]):
-            courses = str(row["courses"]).lower()
-            if "food handling" in courses or "haccp" in courses:
-                score += 3  # Highest value for food safety certifications
-            elif "food safety" in courses:
-                score += 2  # Medium value for food safety knowledge
-            elif "customer service" in courses:
-                score += 2  # Medium value for customer service training
-            elif courses != "none" and courses != "unknown":
-                score += 1  # Some value for any other training
-        
-        # Visa status scoring
-        if "visa" in row and pd.notna(row["visa"]):
-            visa_status = str(row["visa"]).lower()
-            if visa_status == "stamp 4":
-                score += 3  # Stamp 4 (broader work permissions)
-            elif visa_status == "stamp 2":
-                score += 1  # Stamp 2 (limited work rights, typically students)
-            elif visa_status == "irish":
-                score += 4  # Irish citizens (no visa issues)
-            elif visa_status == "ue":
-                score += 3  # EU citizens (freedom of movement)
-            elif visa_status == "stamp 1g":
-                score += 2  # Stamp 1G (graduate visa)
-            elif visa_status == "stamp 1":
-                score += 0  # Stamp 1 (may have work restrictions)
-        
-        return score
-    
-    # Apply scoring
-    merged_df["priority_score"] = merged_df.apply(calculate_priority, axis=1)
+        # If no survey data, just use resume data (assign adds the columns in a single copy)
+        merged_df = resumes_df.assign(availability="Unknown", courses="Unknown", visa="Unknown")
+    
+    # Calculate priority score column-wise rather than row by row
+    # Resume factors
+    score = merged_df["is_relevant"].astype(int) * 2
+    score += merged_df["keyword_count"].clip(upper=5)  # Max 5 points for keywords
+    
+    # Survey factors (if available)
+    # Availability scoring: other availabilities get a default of 1
+    availability = _lowercase_column(merged_df, "availability")
+    score += availability.map(AVAILABILITY_SCORES).fillna(1).where(availability.notna(), 0)
+    
+    # Course/training scoring
+    courses = _lowercase_column(merged_df, "courses")
+    score += np.select(
+        [
+            courses.str.contains("food handling|haccp", na=False),  # Food safety certifications
+            courses.str.contains("food safety", regex=False, na=False),  # Food safety knowledge
+            courses.str.contains("customer service", regex=False, na=False),  # Customer service training
+            courses.notna() & ~courses.isin(["none", "unknown"])  # Any other training
+        ],
+        [3, 2, 2, 1],
+        default=0
+    )
+    
+    # Visa status scoring
+    visa_status = _lowercase_column(merged_df, "visa")
+    score += visa_status.map(VISA_SCORES).fillna(0)
+    
+    merged_df["priority_score"] = score.astype(int)
     
     # Classify based on score - adjusted thresholds for new scoring system
-    def get_priority_level(score):
-        if score >= 10:
-            return "High"
-        elif score >= 6:
-            return "Medium"
-        else:
-            return "Low"
-    
-    merged_df["priority"] = merged_df["priority_score"].apply(get_priority_level)
+    merged_df["priority"] = np.select(
+        [merged_df["priority_score"] >= 10, merged_df["priority_score"] >= 6],
+        ["High", "Medium"],
+        default="Low"
+    )
     
     return merged_df
 
 
 def visualize_results(classified_df):
     """Create a visualization of the screening results."""
+    # Imported here so runs that never chart do not pay matplotlib's startup cost
+    import matplotlib
+    matplotlib.use("Agg")  # Render charts to files only, no GUI backend needed
+    import matplotlib.pyplot as plt
+    
     try:
         # Count candidates by priority
         priority_counts = classified_df["priority"].value_counts()
         
         # Create a bar chart
-        plt.figure(figsize=(10, 6))
-        bars = plt.bar(priority_counts.index, priority_counts.values, color=["green", "orange", "red"])
+        fig, ax = plt.subplots(figsize=(10, 6))
+        bars = ax.bar(priority_counts.index, priority_counts.values, color=["green", "orange", "red"])
         
         # Add labels and title
-        plt.xlabel("Priority Level")
-        plt.ylabel("Number of Candidates")
-        plt.title("Resume Screening Results by Priority")
+        ax.set_xlabel("Priority Level")
+        ax.set_ylabel("Number of Candidates")
+        ax.set_title("Resume Screening Results by Priority")
         
         # Add count labels on top of bars
         for bar in bars:
             height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
                     f"{height:.0f}",
                     ha="center", va="bottom")
         
         # Save the chart
         chart_path = os.path.join(OUTPUT_DIR, "screening_results.png")
-        plt.savefig(chart_path)
+        fig.savefig(chart_path)
+        plt.close(fig)
         logger.info(f"Results visualization saved to {chart_path}")
         
         # Create a pie chart of keyword distribution
-        plt.figure(figsize=(10, 6))
-        keyword_data = {}
+        fig, ax = plt.subplots(figsize=(10, 6))
         
-        # Extract all keywords found
-        for keywords_str in classified_df["found_keywords"]:
-            if pd.notna(keywords_str) and keywords_str:
-                for keyword in keywords_str.split(", "):
-                    if keyword in keyword_data:
-                        keyword_data[keyword] += 1
-                    else:
-                        keyword_data[keyword] = 1
-        
-        # Sort and take top 10 keywords
-        top_keywords = dict(sorted(keyword_data.items(), key=lambda x: x[1], reverse=True)[:10])
+        # Count all keywords found and take the top 10
+        keyword_data = Counter(
+            keyword
+            for keywords_str in classified_df["found_keywords"].dropna()
+            if keywords_str
+            for keyword in keywords_str.split(", ")
+        )
+        top_keywords = dict(keyword_data.most_common(10))
         
         # Create pie chart
-        plt.pie(top_keywords.values(), labels=top_keywords.keys(), autopct='%1.1f%%')
-        plt.title("Top 10 Keywords Found in Resumes")
+        ax.pie(top_keywords.values(), labels=top_keywords.keys(), autopct='%1.1f%%')
+        ax.set_title("Top 10 Keywords Found in Resumes")
         
         # Save the chart
         keyword_chart_path = os.path.join(OUTPUT_DIR, "keyword_distribution.png")
-        plt.savefig(keyword_chart_path)
+        fig.savefig(keyword_chart_path)
+        plt.close(fig)
         logger.info(f"Keyword distribution chart saved to {keyword_chart_path}")
         
     except Exception as e:
         logger.error(f"Error creating visualization: {e}")
 
 
-def monitor_input_folder(keywords):
-    """Monitor the input folder for new PDFs and process them."""
+def monitor_input_folder(keywords, automaton=None, on_result=None):
+    """Monitor the input folder for new PDFs and process them, passing each result to on_result as it completes."""
     logger.info(f"Monitoring {INPUT_DIR} for new PDFs...")
     
-    # Get list of PDF files
-    pdf_files = [f for f in os.listdir(INPUT_DIR) if f.lower().endswith('.pdf')]
+    # Get list of PDF files (scandir entries carry their own path and file type)
+    with os.scandir(INPUT_DIR) as entries:
+        pdf_files = [entry for entry in entries if entry.is_file() and entry.name.lower().endswith('.pdf')]
     
     if not pdf_files:
         logger.warning(f"No PDF files found in {INPUT_DIR}")
@@ -452,25 +628,57 @@ def monitor_input_folder(keywords):
     
     logger.info(f"Found {len(pdf_files)} PDF files to process")
     
-    # Process each PDF
+    # Process PDFs in parallel; each resume is independent of the others
     resume_data = []
-    for pdf_file in pdf_files:
-        pdf_path = os.path.join(INPUT_DIR, pdf_file)
-        data = process_resume(pdf_path, keywords)
-        if data:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(process_resume, pdf_file.path, keywords, automaton): pdf_file
+            for pdf_file in pdf_files
+        }
+        
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error(f"Error processing {pdf_file.name}: {e}")
+                continue
+            
+            if not data:
+                continue
+            
             resume_data.append(data)
+            if on_result:
+                on_result(data)
             
             # Move processed file to processed directory
-            processed_path = os.path.join(PROCESSED_DIR, pdf_file)
+            processed_path = os.path.join(PROCESSED_DIR, pdf_file.name)
             try:
-                os.rename(pdf_path, processed_path)
-                logger.info(f"Moved {pdf_file} to {PROCESSED_DIR}")
+                os.replace(pdf_file.path, processed_path)
+                logger.info(f"Moved {pdf_file.name} to {PROCESSED_DIR}")
             except Exception as e:
-                logger.error(f"Error moving {pdf_file}: {e}")
+                logger.error(f"Error moving {pdf_file.name}: {e}")
     
+    # Results arrive in completion order; sort so reruns on the same input classify and email in the same order
+    resume_data.sort(key=lambda data: data["file_name"])
     return resume_data
 
 
+def load_interrupted_rows(tmp_csv):
+    """Load resume rows streamed to the temporary CSV by a run that did not finish."""
+    if not os.path.exists(tmp_csv):
+        return []
+    
+    with open(tmp_csv, newline="", encoding="utf-8") as f:
+        # A row cut short by the interruption has no file name and is skipped
+        rows = [row for row in csv.DictReader(f) if row.get("file_name")]
+    
+    for row in rows:
+        row["keyword_count"] = int(row["keyword_count"])
+        row["is_relevant"] = row["is_relevant"] == "True"
+    return rows
+
+
 def load_survey_responses():
     """Load survey responses from CSV file."""
     try:
@@ -492,28 +700,48 @@ def main():
     
     # Load keywords
     keywords = load_keywords()
-    
-    # Monitor input folder and process resumes
-    resume_data = monitor_input_folder(keywords)
+    automaton = build_keyword_automaton(keywords)
+    
+    # Monitor input folder and process resumes, streaming each row to a temporary CSV as it completes;
+    # the previous results are only replaced once this run has produced at least one row
+    tmp_csv = EXTRACTED_CSV + ".tmp"
+    
+    # Rows left by an interrupted run belong to PDFs already moved to processed/, so carry them over
+    interrupted_rows = load_interrupted_rows(tmp_csv)
+    if interrupted_rows:
+        logger.warning(f"Recovered {len(interrupted_rows)} resumes from an interrupted run")
+    
+    # Rewrite rather than append, so a row cut short by the interruption does not corrupt the file
+    with open(tmp_csv, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=RESUME_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(interrupted_rows)
+        csv_file.flush()
+        
+        def save_row(data):
+            writer.writerow(data)
+            csv_file.flush()
+        
+        resume_data = interrupted_rows + monitor_input_folder(keywords, automaton, on_result=save_row)
     
     if not resume_data:
+        os.remove(tmp_csv)
         logger.warning("No resume data to process")
         return
     
-    # Create DataFrame from resume data
-    resumes_df = pd.DataFrame(resume_data)
+    os.replace(tmp_csv, EXTRACTED_CSV)
+    logger.info(f"Saved extracted resume data to {EXTRACTED_CSV}")
     
-    # Save extracted data to CSV
-    extracted_csv = os.path.join(OUTPUT_DIR, "extracted_resumes.csv")
-    resumes_df.to_csv(extracted_csv, index=False)
-    logger.info(f"Saved extracted resume data to {extracted_csv}")
+    # Create DataFrame from resume data
+    resumes_df = pd.DataFrame(resume_data, columns=RESUME_FIELDS)
     
-    # Simulate sending survey emails to relevant candidates
+    # Send survey emails to relevant candidates over a single SMTP session
     relevant_candidates = resumes_df[resumes_df["is_relevant"] == True]
     logger.info(f"Found {len(relevant_candidates)} relevant candidates")
     
-    for _, candidate in relevant_candidates.iterrows():
-        send_survey_email(candidate)
+    with smtp_session() as smtp:
+        for candidate in relevant_candidates.to_dict(orient="records"):
+            send_survey_email(candidate, smtp=smtp)
     
     # Load survey responses
     survey_df = load_survey_responses()
@@ -525,10 +753,11 @@ def main():
     classified_df.to_csv(OUTPUT_CSV, index=False)
     logger.info(f"Saved classified candidates to {OUTPUT_CSV}")
     
-    # Simulate sending interview invitations
-    for _, candidate in classified_df.iterrows():
-        if candidate["is_relevant"] and pd.notna(candidate["priority"]):
-            send_interview_email(candidate, candidate["priority"])
+    # Send interview invitations over a single SMTP session
+    with smtp_session() as smtp:
+        for candidate in classified_df.to_dict(orient="records"):
+            if candidate["is_relevant"] and pd.notna(candidate["priority"]):
+                send_interview_email(candidate, candidate["priority"], smtp=smtp)
     
     # Visualize results
     visualize_results(classified_df)